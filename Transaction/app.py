@@ -11,7 +11,12 @@ import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
 import json
+import logging
+import os
+import tempfile
+import time
 from datetime import datetime
+from typing import Optional
 import requests
 
 # Import our modules
@@ -21,7 +26,8 @@ from src.json_adapter import JSONAdapter
 from src.adapters.ibi_adapter import IBIAdapter
 from src.modules.portfolio_dashboard import (
     PortfolioBuilder,
-    display_portfolio_by_currency
+    display_portfolio_by_currency,
+    update_positions_with_prices
 )
 
 
@@ -53,29 +59,95 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+logger = logging.getLogger(__name__)
+
+EXCHANGE_RATE_TTL = 3600  # 1 hour
+FALLBACK_EXCHANGE_RATE = 3.6  # Approximate USD→ILS rate used when the API is unavailable
+# Resolved from this file so the cache lands in the same place whatever the working directory
+CACHE_DIR = Path(__file__).parent / "output" / "cache"
+EXCHANGE_RATE_CACHE_FILE = CACHE_DIR / "fx_rate.json"
+
+
+def load_cached_exchange_rate(max_age: Optional[float] = None):
+    """
+    Load the last fetched exchange rate from disk.
+
+    Args:
+        max_age: Maximum age in seconds (None accepts any age)
+
+    Returns:
+        Cached rate, or None if missing, unreadable or too old
+    """
+    try:
+        cached = json.loads(EXCHANGE_RATE_CACHE_FILE.read_text(encoding='utf-8'))
+        rate, fetched_at = float(cached['rate']), float(cached['ts'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if max_age is not None and time.time() - fetched_at >= max_age:
+        return None
+    return rate
+
+
+def save_cached_exchange_rate(rate: float):
+    """Persist the exchange rate to disk (atomic replace, best effort)."""
+    try:
+        EXCHANGE_RATE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=EXCHANGE_RATE_CACHE_FILE.parent, delete=False
+        ) as tmp:
+            json.dump({'rate': rate, 'ts': time.time()}, tmp)
+        os.replace(tmp.name, EXCHANGE_RATE_CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Error caching exchange rate: {e}")
+
+
+@st.cache_data(ttl=EXCHANGE_RATE_TTL)
+def fetch_exchange_rate() -> float:
+    """
+    Fetch the ILS/USD exchange rate, from the disk cache if still fresh.
+
+    Raises on failure; Streamlit does not cache exceptions, so a transient
+    outage is retried on the next call instead of pinning the fallback rate
+    for the whole TTL.
+    """
+    # A rate fetched by a previous process within the TTL is reused as-is
+    cached_rate = load_cached_exchange_rate(max_age=EXCHANGE_RATE_TTL)
+    if cached_rate is not None:
+        return cached_rate
+
+    # Using exchangerate-api.com (free tier)
+    response = requests.get('https://api.exchangerate-api.com/v4/latest/USD', timeout=5)
+    response.raise_for_status()
+    data = response.json()
+    rate = float(data['rates'].get('ILS', FALLBACK_EXCHANGE_RATE))
+
+    save_cached_exchange_rate(rate)
+    return rate
+
+
 def get_current_exchange_rate():
     """Get current ILS/USD exchange rate from API."""
     try:
-        # Using exchangerate-api.com (free tier)
-        response = requests.get('https://api.exchangerate-api.com/v4/latest/USD', timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            ils_rate = data['rates'].get('ILS', 3.6)  # Default fallback
-            return ils_rate
+        return fetch_exchange_rate()
     except Exception as e:
         print(f"Error fetching exchange rate: {e}")
 
+    # Prefer the last known rate (even if stale) over the fixed approximation
+    last_rate = load_cached_exchange_rate()
+    if last_rate is not None:
+        return last_rate
+
     # Fallback to approximate rate if API fails
-    return 3.6
+    return FALLBACK_EXCHANGE_RATE
 
 
 @st.cache_data
 def load_ibi_data(file_path: str):
     """Load and process IBI Excel file."""
     try:
-        # Read Excel file
-        reader = ExcelReader()
+        # Read Excel file (parsed sheets are cached until the file changes)
+        reader = ExcelReader(cache_dir=str(CACHE_DIR))
         df_raw = reader.read(file_path)
 
         # Transform using IBI adapter
@@ -93,6 +165,19 @@ def load_ibi_data(file_path: str):
         return None, None
 
 
+@st.cache_data
+def build_portfolio(file_path: str, _transactions):
+    """
+    Build currency-separated portfolio from transaction history (no prices).
+
+    Cached per file (the transactions are already cached by load_ibi_data,
+    so the leading underscore keeps Streamlit from hashing them). Prices are
+    added by the caller so their refresh follows the price fetcher's cache.
+    """
+    builder = PortfolioBuilder()
+    return builder.build_by_currency(_transactions, fetch_prices=False)
+
+
 def main():
     """Main application function."""
 
@@ -161,12 +246,12 @@ def main():
             st.metric("Current Balance", f"₪{final_balance:,.2f}")
 
         with col4:
-            total_fees = df['transaction_fee'].sum() + df['additional_fees'].sum()
+            total_fees = df[['transaction_fee', 'additional_fees']].sum().sum()
             st.metric("Total Fees Paid", f"₪{total_fees:,.2f}")
 
         with col5:
-            buys = sum(1 for t in transactions if t.is_buy)
-            sells = sum(1 for t in transactions if t.is_sell)
+            buys = sum(t.is_buy for t in transactions)
+            sells = sum(t.is_sell for t in transactions)
             st.metric("Buy/Sell Ratio", f"{buys}/{sells}")
 
         # Second row: Investment totals
@@ -224,20 +309,19 @@ def main():
                 all_securities = ['All'] + sorted(df['security_name'].unique().tolist())
                 selected_security = st.selectbox("Security", all_securities)
 
-            # Apply filters
-            df_filtered = df.copy()
+            # Apply filters - combined into one mask, indexed once
+            mask = pd.Series(True, index=df.index)
 
             if len(date_range) == 2:
-                df_filtered = df_filtered[
-                    (df_filtered['date'] >= pd.Timestamp(date_range[0])) &
-                    (df_filtered['date'] <= pd.Timestamp(date_range[1]))
-                ]
+                mask &= df['date'].between(pd.Timestamp(date_range[0]), pd.Timestamp(date_range[1]))
 
             if selected_type != 'All':
-                df_filtered = df_filtered[df_filtered['transaction_type'] == selected_type]
+                mask &= df['transaction_type'] == selected_type
 
             if selected_security != 'All':
-                df_filtered = df_filtered[df_filtered['security_name'] == selected_security]
+                mask &= df['security_name'] == selected_security
+
+            df_filtered = df[mask]
 
             # Display transactions
             st.write(f"Showing {len(df_filtered)} transactions")
@@ -310,7 +394,7 @@ def main():
             with col2:
                 # Securities by total volume
                 st.markdown("#### Securities by Total Amount")
-                security_amounts = df.groupby('security_name')['amount_local_currency'].sum().abs().sort_values(ascending=False).head(10)
+                security_amounts = df.groupby('security_name')['amount_local_currency'].sum().abs().nlargest(10)
 
                 fig_amounts = px.bar(
                     x=security_amounts.values,
@@ -374,8 +458,12 @@ def main():
 
                 # Build portfolio from transaction data with current prices
                 with st.spinner("Building portfolio and fetching current prices..."):
-                    builder = PortfolioBuilder()
-                    positions_by_currency = builder.build_by_currency(transactions, fetch_prices=True)
+                    positions_by_currency = build_portfolio(selected_file_path, transactions)
+
+                    # st.cache_data keeps its own pickled copy, so prices set here
+                    # never leak into the cached build
+                    for positions in positions_by_currency.values():
+                        update_positions_with_prices(positions)
 
                 # Get current exchange rate for proper currency conversion
                 exchange_rate = get_current_exchange_rate()
@@ -11,6 +11,10 @@ import json
 from datetime import datetime
 
 
+# Section separator for console output
+SEPARATOR = "=" * 80
+
+
 class IBIReader:
     """Simple IBI Excel reader with complete field mapping."""
 
@@ -46,52 +50,64 @@ class IBIReader:
 
     def display_summary(self, df: pd.DataFrame):
         """Display summary statistics."""
-        print("\n" + "="*80)
-        print("📊 TRANSACTION SUMMARY")
-        print("="*80)
+        # Build the report first and write it with a single print
+        lines = [
+            "\n" + SEPARATOR,
+            "📊 TRANSACTION SUMMARY",
+            SEPARATOR,
+        ]
 
-        print(f"\n📅 Date Range: {df['date'].min()} to {df['date'].max()}")
-        print(f"📝 Total Transactions: {len(df)}")
+        date_min, date_max = df['date'].agg(['min', 'max'])
+        lines.append(f"\n📅 Date Range: {date_min} to {date_max}")
+        lines.append(f"📝 Total Transactions: {len(df)}")
 
         if 'transaction_type' in df.columns:
-            print(f"\n💼 Transaction Types:")
+            lines.append(f"\n💼 Transaction Types:")
             type_counts = df['transaction_type'].value_counts()
-            for trans_type, count in type_counts.items():
-                print(f"   - {trans_type}: {count}")
+            lines.extend(f"   - {trans_type}: {count}" for trans_type, count in type_counts.items())
 
         if 'security_name' in df.columns:
-            print(f"\n🏢 Unique Securities: {df['security_name'].nunique()}")
+            lines.append(f"\n🏢 Unique Securities: {df['security_name'].nunique()}")
             top_securities = df['security_name'].value_counts().head(5)
-            print(f"\n   Top 5 Most Traded:")
-            for security, count in top_securities.items():
-                print(f"   - {security}: {count} transactions")
+            lines.append(f"\n   Top 5 Most Traded:")
+            lines.extend(f"   - {security}: {count} transactions" for security, count in top_securities.items())
 
         if 'balance' in df.columns:
-            print(f"\n💰 Final Balance: ₪{df['balance'].iloc[-1]:,.2f}")
+            lines.append(f"\n💰 Final Balance: ₪{df['balance'].iloc[-1]:,.2f}")
 
         if 'transaction_fee' in df.columns:
-            total_fees = df['transaction_fee'].sum() + df['additional_fees'].sum()
-            print(f"💸 Total Fees Paid: ₪{total_fees:,.2f}")
+            total_fees = df[['transaction_fee', 'additional_fees']].sum().sum()
+            lines.append(f"💸 Total Fees Paid: ₪{total_fees:,.2f}")
+
+        print("\n".join(lines))
 
     def display_sample(self, df: pd.DataFrame, n: int = 5):
         """Display sample transactions."""
-        print(f"\n" + "="*80)
-        print(f"📋 SAMPLE TRANSACTIONS (First {n})")
-        print("="*80)
-
-        for idx, row in df.head(n).iterrows():
-            print(f"\n🔹 Transaction #{idx + 1}")
-            print(f"   Date: {row.get('date', 'N/A')}")
-            print(f"   Type: {row.get('transaction_type', 'N/A')}")
-            print(f"   Security: {row.get('security_name', 'N/A')}")
-            print(f"   Symbol: {row.get('security_symbol', 'N/A')}")
-            print(f"   Quantity: {row.get('quantity', 0):.2f}")
-            print(f"   Price: {row.get('execution_price', 0):.2f}")
-            print(f"   Currency: {row.get('currency', 'N/A')}")
-            print(f"   Amount (NIS): ₪{row.get('amount_local_currency', 0):,.2f}")
-            print(f"   Balance: ₪{row.get('balance', 0):,.2f}")
+        lines = [
+            "\n" + SEPARATOR,
+            f"📋 SAMPLE TRANSACTIONS (First {n})",
+            SEPARATOR,
+        ]
+
+        # Plain dict records - avoids building a Series per row like iterrows()
+        sample = df.head(n)
+        for idx, row in zip(sample.index, sample.to_dict(orient='records')):
+            lines.extend([
+                f"\n🔹 Transaction #{idx + 1}",
+                f"   Date: {row.get('date', 'N/A')}",
+                f"   Type: {row.get('transaction_type', 'N/A')}",
+                f"   Security: {row.get('security_name', 'N/A')}",
+                f"   Symbol: {row.get('security_symbol', 'N/A')}",
+                f"   Quantity: {row.get('quantity', 0):.2f}",
+                f"   Price: {row.get('execution_price', 0):.2f}",
+                f"   Currency: {row.get('currency', 'N/A')}",
+                f"   Amount (NIS): ₪{row.get('amount_local_currency', 0):,.2f}",
+                f"   Balance: ₪{row.get('balance', 0):,.2f}",
+            ])
             if row.get('transaction_fee', 0) > 0:
-                print(f"   Fee: ₪{row.get('transaction_fee', 0):.2f}")
+                lines.append(f"   Fee: ₪{row.get('transaction_fee', 0):.2f}")
+
+        print("\n".join(lines))
 
     def export_to_json(self, df: pd.DataFrame, output_path: str):
         """Export to JSON format."""
@@ -143,9 +159,7 @@ class IBIReader:
 
 def main():
     """Main demo function."""
-    print("="*80)
-    print("🏦 IBI SECURITIES TRADING TRANSACTION READER - DEMO")
-    print("="*80)
+    print(f"{SEPARATOR}\n🏦 IBI SECURITIES TRADING TRANSACTION READER - DEMO\n{SEPARATOR}")
 
     # Initialize reader
     reader = IBIReader()
@@ -159,9 +173,10 @@ def main():
         print("   Expected files like: 'IBI trans 2024.xlsx'")
         return
 
-    print(f"\n📁 Found {len(ibi_files)} IBI file(s):")
-    for f in ibi_files:
-        print(f"   - {f.name}")
+    print("\n".join(
+        [f"\n📁 Found {len(ibi_files)} IBI file(s):"] +
+        [f"   - {f.name}" for f in ibi_files]
+    ))
 
     # Process the most recent file
     latest_file = sorted(ibi_files)[-1]
@@ -170,17 +185,19 @@ def main():
     df_raw = reader.read_excel(latest_file)
 
     # Show original columns
-    print(f"\n📋 Original Excel Columns ({len(df_raw.columns)}):")
-    for i, col in enumerate(df_raw.columns, 1):
-        print(f"   {i}. {col}")
+    print("\n".join(
+        [f"\n📋 Original Excel Columns ({len(df_raw.columns)}):"] +
+        [f"   {i}. {col}" for i, col in enumerate(df_raw.columns, 1)]
+    ))
 
     # Standardize columns
     df = reader.standardize_columns(df_raw)
 
     # Verify all 13 fields are present
-    print(f"\n✅ Standardized Columns ({len(df.columns)}):")
-    for i, col in enumerate(df.columns, 1):
-        print(f"   {i}. {col}")
+    print("\n".join(
+        [f"\n✅ Standardized Columns ({len(df.columns)}):"] +
+        [f"   {i}. {col}" for i, col in enumerate(df.columns, 1)]
+    ))
 
     # Display summary
     reader.display_summary(df)
@@ -192,14 +209,16 @@ def main():
     output_path = f"output/demo_ibi_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     reader.export_to_json(df, output_path)
 
-    print("\n" + "="*80)
-    print("✅ DEMO COMPLETE!")
-    print("="*80)
-    print(f"\n💡 All 13 IBI fields successfully read and processed!")
-    print(f"   Including stock names: ✅")
-    print(f"   Including transaction types: ✅")
-    print(f"   Including fees and taxes: ✅")
-    print(f"   Multi-currency support: ✅")
+    print("\n".join([
+        "\n" + SEPARATOR,
+        "✅ DEMO COMPLETE!",
+        SEPARATOR,
+        "\n💡 All 13 IBI fields successfully read and processed!",
+        "   Including stock names: ✅",
+        "   Including transaction types: ✅",
+        "   Including fees and taxes: ✅",
+        "   Multi-currency support: ✅",
+    ]))
 
 
 if __name__ == "__main__":
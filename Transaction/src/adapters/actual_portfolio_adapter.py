@@ -5,6 +5,8 @@ Reads IBI's current portfolio file (actual positions with market values).
 This represents the broker's real-time holdings data.
 """
 
+import re
+import numpy as np
 import pandas as pd
 from typing import List, Dict
 from pathlib import Path
@@ -111,23 +113,27 @@ class ActualPortfolioAdapter(BaseAdapter):
         # 3. Remove tax entries (מס לשלם, מס תקבולים)
         # 4. Keep only positive quantity stock positions
 
+        # All filters are combined into one mask so the frame is copied once
+        keep = pd.Series(True, index=df_transformed.index)
+
         if 'quantity' in df_transformed.columns:
-            df_transformed = df_transformed[df_transformed['quantity'] > 0].copy()
+            keep &= df_transformed['quantity'] > 0
 
         if 'security_type' in df_transformed.columns:
             # Filter out derivatives and tax entries
             exclude_types = ['אופציית', 'תפ"ס', 'פח"ק']
-            for exclude_type in exclude_types:
-                df_transformed = df_transformed[
-                    ~df_transformed['security_type'].str.contains(exclude_type, na=False)
-                ].copy()
+            keep &= ~df_transformed['security_type'].str.contains(
+                '|'.join(map(re.escape, exclude_types)), na=False
+            )
 
         if 'security_name' in df_transformed.columns:
             # Exclude tax-related entries
             exclude_names = ['מס לשלם', 'מס תקבולים', 'מס ששולם']
-            df_transformed = df_transformed[
-                ~df_transformed['security_name'].str.contains('|'.join(exclude_names), na=False)
-            ].copy()
+            keep &= ~df_transformed['security_name'].str.contains(
+                '|'.join(map(re.escape, exclude_names)), na=False
+            )
+
+        df_transformed = df_transformed[keep].copy()
 
         # Clean numeric columns
         numeric_columns = [
@@ -156,20 +162,22 @@ class ActualPortfolioAdapter(BaseAdapter):
 
         # Use symbol if available, otherwise use security number or name
         if 'security_symbol' in df_transformed.columns:
-            df_transformed['symbol_clean'] = df_transformed.apply(
-                lambda row: (
-                    row['security_symbol'] if pd.notna(row['security_symbol']) and row['security_symbol'].strip()
-                    else row.get('security_number', row.get('security_name', ''))
-                ),
-                axis=1
-            )
+            symbols = df_transformed['security_symbol']
+            if 'security_number' in df_transformed.columns:
+                fallback = df_transformed['security_number']
+            elif 'security_name' in df_transformed.columns:
+                fallback = df_transformed['security_name']
+            else:
+                fallback = ''
+            has_symbol = symbols.notna() & (symbols.astype(str).str.strip() != '')
+            df_transformed['symbol_clean'] = np.where(has_symbol, symbols, fallback)
 
         # Calculate average cost per share
         if 'cost_basis' in df_transformed.columns and 'quantity' in df_transformed.columns:
-            df_transformed['avg_cost'] = df_transformed.apply(
-                lambda row: row['cost_basis'] / row['quantity'] if row['quantity'] > 0 else 0,
-                axis=1
-            )
+            quantity = df_transformed['quantity']
+            df_transformed['avg_cost'] = (
+                df_transformed['cost_basis'] / quantity.where(quantity > 0)
+            ).where(quantity > 0, 0.0)
 
         # Add source identifier
         df_transformed['source'] = 'actual'
@@ -228,19 +236,22 @@ class ActualPortfolioAdapter(BaseAdapter):
         Returns:
             Dictionary with summary statistics
         """
-        # Group by currency
-        by_currency = {}
-
-        for currency in df['currency'].unique():
-            currency_df = df[df['currency'] == currency]
-
-            by_currency[currency] = {
-                'total_positions': len(currency_df),
-                'total_market_value': currency_df['market_value'].sum(),
-                'total_cost_basis': currency_df['cost_basis'].sum(),
-                'total_unrealized_pnl': currency_df['total_pnl'].sum(),
-                'total_daily_pnl': currency_df['daily_pnl'].sum(),
+        # Group by currency (one groupby pass instead of a filter per currency);
+        # dropna=False keeps positions with a missing currency in the summary
+        grouped = df.groupby('currency', sort=False, dropna=False)
+        totals = grouped[['market_value', 'cost_basis', 'total_pnl', 'daily_pnl']].sum()
+        totals['count'] = grouped.size()
+
+        by_currency = {
+            currency: {
+                'total_positions': int(row['count']),
+                'total_market_value': row['market_value'],
+                'total_cost_basis': row['cost_basis'],
+                'total_unrealized_pnl': row['total_pnl'],
+                'total_daily_pnl': row['daily_pnl'],
             }
+            for currency, row in totals.to_dict('index').items()
+        }
 
         # Overall stats
         return {
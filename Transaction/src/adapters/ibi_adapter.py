@@ -165,11 +165,15 @@ class IBIAdapter(BaseAdapter):
             df_transformed['bank'] = self.bank_name
             df_transformed['account_type'] = self.account_type
 
+            # Low-cardinality string columns are stored as categoricals
+            # (integer codes instead of one Python string per row)
+            for col in ('currency', 'bank', 'account_type'):
+                if col in df_transformed.columns:
+                    df_transformed[col] = df_transformed[col].astype('category')
+
             # Generate unique IDs with error handling
             try:
-                df_transformed['id'] = df_transformed.apply(
-                    lambda row: self._generate_transaction_id(row), axis=1
-                )
+                df_transformed['id'] = self._generate_transaction_ids(df_transformed)
             except Exception as e:
                 logger.error(f"Error generating transaction IDs: {e}")
                 # Fallback: simple sequential IDs
@@ -198,13 +202,12 @@ class IBIAdapter(BaseAdapter):
             'quantity', 'currency', 'balance'
         ]
 
-        missing = []
-        for req_col in required_columns:
-            hebrew_col = mapping.get(req_col)
-            if hebrew_col and hebrew_col not in df.columns:
-                missing.append(f"{req_col} ({hebrew_col})")
-
-        return missing
+        present = set(df.columns)
+        return [
+            f"{req_col} ({mapping[req_col]})"
+            for req_col in required_columns
+            if req_col in mapping and mapping[req_col] not in present
+        ]
 
     def _parse_dates(self, date_series: pd.Series) -> pd.Series:
         """
@@ -240,25 +243,37 @@ class IBIAdapter(BaseAdapter):
                 logger.error(f"Date auto-detection failed: {e2}")
                 raise ValueError(f"Cannot parse dates: {e}")
 
-    def _generate_transaction_id(self, row: pd.Series) -> str:
+    def _generate_transaction_ids(self, df: pd.DataFrame) -> pd.Series:
         """
-        Generate unique transaction ID.
+        Generate unique transaction IDs for all rows.
 
         Combines date, transaction type, and security symbol to create
-        a unique identifier.
+        a unique identifier. Built column-wise rather than with a
+        row-wise apply.
 
         Args:
-            row: DataFrame row
+            df: Transformed DataFrame
 
         Returns:
-            Unique transaction ID string
+            Series of unique transaction ID strings
         """
-        date_str = row['date'].strftime('%Y%m%d') if isinstance(row['date'], datetime) else str(row['date'])
-        trans_type = str(row.get('transaction_type', ''))[:5]
-        symbol = str(row.get('security_symbol', ''))[:10]
-        amount = str(abs(row.get('amount_local_currency', 0)))[:8]
-
-        return f"IBI_{date_str}_{trans_type}_{symbol}_{amount}".replace(' ', '_')
+        dates = df['date']
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            date_str = dates.dt.strftime('%Y%m%d')
+        else:
+            date_str = dates.map(
+                lambda d: d.strftime('%Y%m%d') if isinstance(d, datetime) else str(d)
+            )
+        trans_type = df['transaction_type'].astype(str).str[:5]
+        symbol = df['security_symbol'].astype(str).str[:10]
+        # str(float) formatting has no vectorized equivalent; format plain floats in one pass
+        amount = pd.Series(
+            [str(abs(a))[:8] for a in df['amount_local_currency'].tolist()],
+            index=df.index
+        )
+
+        ids = 'IBI_' + date_str + '_' + trans_type + '_' + symbol + '_' + amount
+        return ids.str.replace(' ', '_', regex=False)
 
     def categorize_transaction(self, transaction_type: str) -> str:
         """
@@ -4,6 +4,8 @@ Universal Excel file reader.
 This module provides functionality to read Excel files regardless of their structure.
 """
 
+import hashlib
+import pickle
 import pandas as pd
 from typing import Optional
 from pathlib import Path
@@ -12,14 +14,19 @@ from pathlib import Path
 class ExcelReader:
     """Universal Excel file reader that works with any Excel structure."""
     
-    def __init__(self, encoding: str = 'utf-8'):
+    def __init__(self, encoding: str = 'utf-8', cache_dir: Optional[str] = None):
         """
         Initialize Excel reader.
         
         Args:
             encoding: Character encoding for reading files
+            cache_dir: Optional directory for caching parsed sheets. When set,
+                       each parsed sheet is pickled there and reused until the
+                       source file's size or modification time changes; the
+                       entry is then overwritten in place.
         """
         self.encoding = encoding
+        self.cache_dir = Path(cache_dir) if cache_dir else None
     
     def read(self, file_path: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
         """
@@ -44,17 +51,80 @@ class ExcelReader:
         if path.suffix not in ['.xlsx', '.xls']:
             raise ValueError(f"File is not an Excel file: {file_path}")
         
+        cache_path = self._get_cache_path(path, sheet_name)
+        stat = path.stat()
+        if cache_path is not None:
+            cached = self._read_cache(cache_path, stat)
+            if cached is not None:
+                return cached
+        
         try:
-            # Read Excel file
+            # pandas opens the workbook read_only/data_only with openpyxl
             if sheet_name:
                 df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
             else:
                 df = pd.read_excel(file_path, engine='openpyxl')
-            
-            return df
         
         except Exception as e:
             raise ValueError(f"Error reading Excel file {file_path}: {str(e)}")
+        
+        if cache_path is not None:
+            self._write_cache(df, cache_path, stat)
+        
+        return df
+    
+    def _get_cache_path(self, path: Path, sheet_name: Optional[str]) -> Optional[Path]:
+        """
+        Get the cache file path for a source file and sheet.
+        
+        There is one entry per (file, sheet); the file's size and
+        modification time are stored inside it, so an edited file reuses
+        (and overwrites) the same entry instead of leaving old ones behind.
+        
+        Returns:
+            Path of the cache file, or None if caching is disabled
+        """
+        if self.cache_dir is None:
+            return None
+        
+        key = f"{path.resolve()}|{sheet_name or ''}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{path.stem}_{digest}.pkl"
+    
+    @staticmethod
+    def _read_cache(cache_path: Path, stat) -> Optional[pd.DataFrame]:
+        """
+        Read a cached sheet if it was parsed from the file's current version.
+        
+        Returns:
+            Cached DataFrame, or None if missing, stale or unreadable
+        """
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                entry = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Corrupt or incompatible cache entry - re-parse
+            return None
+        
+        if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            return None
+        return entry['df']
+    
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, cache_path: Path, stat) -> None:
+        """Write a parsed sheet to the cache (best effort - failures are ignored)."""
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'df': df}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass
     
     def get_sheet_names(self, file_path: str) -> list:
         """
@@ -72,8 +142,9 @@ class ExcelReader:
             raise FileNotFoundError(f"Excel file not found: {file_path}")
         
         try:
-            xl_file = pd.ExcelFile(file_path, engine='openpyxl')
-            return xl_file.sheet_names
+            # Close the workbook handle once the names are read
+            with pd.ExcelFile(file_path, engine='openpyxl') as xl_file:
+                return xl_file.sheet_names
         except Exception as e:
             raise ValueError(f"Error reading sheet names from {file_path}: {str(e)}")
     
@@ -4,8 +4,29 @@ Automatic file discovery for Excel transaction files.
 This module scans directories and finds Excel files.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+
+@lru_cache(maxsize=8)
+def _scan_excel_files(directory: str, mtime_ns: int) -> Tuple[Path, ...]:
+    """
+    Scan a directory for Excel files.
+    
+    Cached on the directory's modification time, which changes whenever a
+    file is added, removed or renamed, so repeated scans of an unchanged
+    directory are served from memory.
+    """
+    data_directory = Path(directory)
+    excel_files = []
+    
+    # Find all .xlsx and .xls files
+    for pattern in ['*.xlsx', '*.xls']:
+        excel_files.extend(data_directory.glob(pattern))
+    
+    # Sort by name
+    return tuple(sorted(excel_files))
 
 
 class FileDiscovery:
@@ -30,16 +51,8 @@ class FileDiscovery:
         if not self.data_directory.exists():
             raise FileNotFoundError(f"Data directory not found: {self.data_directory}")
         
-        excel_files = []
-        
-        # Find all .xlsx and .xls files
-        for pattern in ['*.xlsx', '*.xls']:
-            excel_files.extend(self.data_directory.glob(pattern))
-        
-        # Sort by name
-        excel_files.sort()
-        
-        return excel_files
+        mtime_ns = self.data_directory.stat().st_mtime_ns
+        return list(_scan_excel_files(str(self.data_directory), mtime_ns))
     
     def get_file_list(self) -> List[Dict[str, str]]:
         """
@@ -52,11 +65,12 @@ class FileDiscovery:
         
         file_list = []
         for file in files:
+            stat = file.stat()
             file_list.append({
                 'name': file.name,
                 'path': str(file),
-                'size': file.stat().st_size,
-                'modified': file.stat().st_mtime
+                'size': stat.st_size,
+                'modified': stat.st_mtime
             })
         
         return file_list
@@ -10,11 +10,23 @@ import pandas as pd
 import json
 from datetime import datetime
 from pathlib import Path
+from pydantic import TypeAdapter, ValidationError
 
 from .models.transaction import Transaction
 from src.adapters.base_adapter import BaseAdapter
 
 
+# Numeric Transaction fields, defaulted to 0.0 when a column is missing
+NUMERIC_FIELDS = (
+    'quantity', 'execution_price', 'transaction_fee', 'additional_fees',
+    'amount_foreign_currency', 'amount_local_currency', 'balance',
+    'capital_gains_tax_estimate',
+)
+
+# Built once: compiling the list validator is the expensive part
+_TRANSACTION_LIST = TypeAdapter(List[Transaction])
+
+
 class JSONAdapter:
     """
     Adapter for converting bank data to standardized JSON format.
@@ -44,33 +56,68 @@ class JSONAdapter:
         Returns:
             List of Transaction model instances
         """
-        transactions = []
+        # Defaults for columns an adapter may not provide
+        defaults = {
+            'id': '',
+            'transaction_type': '',
+            'security_name': '',
+            'security_symbol': '',
+            'currency': '₪',
+            'bank': adapter.bank_name,
+            'account': '',
+            **dict.fromkeys(NUMERIC_FIELDS, 0.0),
+        }
+        categorize = getattr(adapter, 'categorize_transaction', None)
+
+        # Pull each model field out as one column (struct-of-arrays) and
+        # zip the columns into records, instead of boxing a dict per row
+        n_rows = len(df)
+        columns = {
+            name: df[name].tolist() if name in df.columns else [defaults[name]] * n_rows
+            for name in Transaction.model_fields
+            if name in df.columns or name in defaults
+        }
 
-        for idx, row in df.iterrows():
-            try:
-                # Create Transaction object
-                trans = Transaction(
-                    id=row.get('id', ''),
-                    date=row.get('date'),
-                    transaction_type=row.get('transaction_type', ''),
-                    security_name=row.get('security_name', ''),
-                    security_symbol=row.get('security_symbol', ''),
-                    quantity=float(row.get('quantity', 0.0)),
-                    execution_price=float(row.get('execution_price', 0.0)),
-                    currency=row.get('currency', '₪'),
-                    transaction_fee=float(row.get('transaction_fee', 0.0)),
-                    additional_fees=float(row.get('additional_fees', 0.0)),
-                    amount_foreign_currency=float(row.get('amount_foreign_currency', 0.0)),
-                    amount_local_currency=float(row.get('amount_local_currency', 0.0)),
-                    balance=float(row.get('balance', 0.0)),
-                    capital_gains_tax_estimate=float(row.get('capital_gains_tax_estimate', 0.0)),
-                    bank=row.get('bank', adapter.bank_name),
-                    account=row.get('account', ''),
-                    category=row.get('category', adapter.categorize_transaction(row.get('transaction_type', '')))
-                    if hasattr(adapter, 'categorize_transaction') else 'other'
-                )
-                transactions.append(trans)
+        indices = df.index.tolist()
+        if categorize is None:
+            columns['category'] = ['other'] * n_rows
+        elif 'category' not in columns:
+            # Categorize each distinct type once; rows whose type cannot be
+            # categorized are reported and skipped
+            categories = {}
+            failed = {}
+            for trans_type in dict.fromkeys(columns['transaction_type']):
+                try:
+                    categories[trans_type] = categorize(trans_type)
+                except Exception as e:
+                    failed[trans_type] = e
+
+            if failed:
+                keep = []
+                for pos, (idx, trans_type) in enumerate(zip(indices, columns['transaction_type'])):
+                    if trans_type in failed:
+                        print(f"Warning: Error creating transaction at row {idx}: {failed[trans_type]}")
+                    else:
+                        keep.append(pos)
+                indices = [indices[pos] for pos in keep]
+                columns = {name: [values[pos] for pos in keep] for name, values in columns.items()}
+
+            columns['category'] = [categories[t] for t in columns['transaction_type']]
+
+        names = list(columns)
+        records = [dict(zip(names, values)) for values in zip(*columns.values())]
+
+        # Validate the whole batch in one pydantic-core call; only if some row
+        # is invalid do we fall back to per-row construction to skip it
+        try:
+            return _TRANSACTION_LIST.validate_python(records)
+        except ValidationError:
+            pass
 
+        transactions = []
+        for idx, record in zip(indices, records):
+            try:
+                transactions.append(Transaction(**record))
             except Exception as e:
                 print(f"Warning: Error creating transaction at row {idx}: {e}")
                 continue
@@ -138,19 +185,20 @@ class JSONAdapter:
         if not transactions:
             return {}
 
-        # Count transaction types
+        # Single pass over the transactions instead of one generator per statistic
         type_counts = {}
+        securities = set()
+        total_fees = 0.0
+        total_buys = total_sells = total_dividends = 0
         for t in transactions:
             type_counts[t.transaction_type] = type_counts.get(t.transaction_type, 0) + 1
+            securities.add(t.security_name)
+            total_fees += t.transaction_fee + t.additional_fees
+            total_buys += t.is_buy
+            total_sells += t.is_sell
+            total_dividends += t.is_dividend
 
-        # Count unique securities
-        unique_securities = len(set(t.security_name for t in transactions))
-
-        # Calculate totals
-        total_fees = sum(t.transaction_fee + t.additional_fees for t in transactions)
-        total_buys = sum(1 for t in transactions if t.is_buy)
-        total_sells = sum(1 for t in transactions if t.is_sell)
-        total_dividends = sum(1 for t in transactions if t.is_dividend)
+        unique_securities = len(securities)
 
         # Final balance
         final_balance = transactions[-1].balance if transactions else 0.0
@@ -6,9 +6,10 @@ Supports complete IBI broker format with all 13 fields.
 """
 
 import logging
+import sys
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from .transaction_classifier import ClassifierFactory, TransactionCategory
 
 # Configure logging for transaction classification
@@ -63,6 +64,12 @@ class Transaction(BaseModel):
             datetime: lambda v: v.strftime('%Y-%m-%d')
         }
 
+    @field_validator('transaction_type', 'security_symbol', 'currency', 'bank')
+    @classmethod
+    def _intern(cls, v: str) -> str:
+        """Share one string object per distinct value (few distinct values, many rows)."""
+        return sys.intern(v)
+
     def _get_classifier(self):
         """Get appropriate classifier for this transaction's broker."""
         try:
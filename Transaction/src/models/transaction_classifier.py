@@ -5,7 +5,9 @@ Provides broker-specific transaction classification logic using strategy pattern
 Extracts classification logic from Transaction model for better separation of concerns.
 """
 
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from enum import Enum
 
@@ -117,6 +119,177 @@ class TransactionClassifier(ABC):
         }
 
 
+# IBI transaction type patterns, matched as substrings of the stripped type.
+# Built once at import rather than on every classification call.
+
+# Explicitly exclude dividend deposits and cash transactions
+# These are cash flows, not share additions
+_IBI_BUY_EXCLUDE = (
+    'דיבידנד',        # Dividend (cash)
+    'דיב',             # Dividend abbreviation
+    'משיכת מס',       # Tax withdrawal (cash)
+    'ריבית',          # Interest (cash)
+    'העברה מזומן',    # Cash transfer
+    'דמי טפול'        # Handling fee
+)
+
+# Buy transactions - add shares to position
+_IBI_BUY_TYPES = (
+    # Regular purchases (all variations)
+    'קניה שח',        # NIS buy
+    'קניה מטח',       # Foreign currency buy
+    'קניה חול מטח',   # Foreign currency buy (abroad)
+    'קניה רצף',       # Continuous buy
+    'קניה מעוף',      # Immediate execution buy
+
+    # Deposits - shares transferred into account
+    'הפקדה',          # Deposit (general)
+    'הפקדה פקיעה',    # Expiration deposit (e.g., option exercise)
+
+    # Benefits/bonuses - shares received as benefit
+    'הטבה',           # Benefit/bonus shares
+
+    # Stock splits and dividends (if they add shares, not cash)
+    'פיצול',          # Stock split
+    'דיבידנד מניות',  # Stock dividend (shares, not cash)
+
+    # English equivalents
+    'Buy', 'Deposit', 'Benefit', 'Split'
+)
+
+# Explicitly exclude cash-only transactions
+# These withdraw cash but don't remove shares
+_IBI_SELL_EXCLUDE = (
+    'דיבידנד',        # Dividend (cash)
+    'דיב',             # Dividend abbreviation
+    'משיכת מס',       # Tax withdrawal (cash only)
+    'משיכת ריבית',    # Interest withdrawal (cash)
+    'העברה מזומן',    # Cash transfer
+    'דמי טפול',       # Handling fee
+    'ריבית מזומן'     # Cash interest
+)
+
+# Sell transactions - remove shares from position
+_IBI_SELL_TYPES = (
+    # Regular sales (all variations)
+    'מכירה שח',       # NIS sell
+    'מכירה מטח',      # Foreign currency sell
+    'מכירה חול מטח',  # Foreign currency sell (abroad)
+    'מכירה רצף',      # Continuous sell
+    'מכירה מעוף',     # Immediate execution sell
+
+    # Withdrawals - shares transferred out of account
+    'משיכה',          # Withdrawal (general)
+    'משיכה פקיעה',    # Expiration withdrawal
+
+    # English equivalents
+    'Sell', 'Withdrawal'
+)
+
+_IBI_DIVIDEND_TYPES = (
+    'דיבידנד',                 # Dividend (general)
+    'דיב',                      # Dividend abbreviation
+    'הפקדה דיבידנד',          # Dividend deposit
+    'Dividend'                  # English
+)
+
+_IBI_FEE_TYPES = (
+    'עמלה',            # Fee/commission
+    'דמי טפול',        # Handling fee
+    'דמי ניהול',       # Management fee
+    'Fee'              # English
+)
+
+_IBI_TAX_TYPES = (
+    'משיכת מס',       # Tax withdrawal
+    'Tax'              # English
+)
+
+_IBI_INTEREST_TYPES = (
+    'ריבית',           # Interest
+    'משיכת ריבית',    # Interest withdrawal
+    'Interest'         # English
+)
+
+_IBI_TRANSFER_TYPES = (
+    'העברה מזומן',     # Cash transfer
+    'העברה',           # Transfer (general)
+    'Transfer'         # English
+)
+
+
+def _compile_patterns(patterns) -> re.Pattern:
+    """Compile substring patterns into one alternation regex (single scan per match)."""
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+
+_IBI_BUY_EXCLUDE_RE = _compile_patterns(_IBI_BUY_EXCLUDE)
+_IBI_BUY_TYPES_RE = _compile_patterns(_IBI_BUY_TYPES)
+_IBI_SELL_EXCLUDE_RE = _compile_patterns(_IBI_SELL_EXCLUDE)
+_IBI_SELL_TYPES_RE = _compile_patterns(_IBI_SELL_TYPES)
+_IBI_DIVIDEND_TYPES_RE = _compile_patterns(_IBI_DIVIDEND_TYPES)
+_IBI_FEE_TYPES_RE = _compile_patterns(_IBI_FEE_TYPES)
+_IBI_TAX_TYPES_RE = _compile_patterns(_IBI_TAX_TYPES)
+_IBI_INTEREST_TYPES_RE = _compile_patterns(_IBI_INTEREST_TYPES)
+_IBI_TRANSFER_TYPES_RE = _compile_patterns(_IBI_TRANSFER_TYPES)
+
+
+# IBI classification predicates.
+#
+# The answer depends only on the (stripped) transaction type string, and a
+# statement only contains a few dozen distinct types, so each predicate is
+# memoized: every Transaction property access after the first for a given
+# type is a dict hit instead of a scan over the pattern lists.
+
+@lru_cache(maxsize=1024)
+def _ibi_is_buy(trans_type: str) -> bool:
+    """IBI buy check on a stripped transaction type (memoized)."""
+    if _IBI_BUY_EXCLUDE_RE.search(trans_type):
+        return False
+
+    return _IBI_BUY_TYPES_RE.search(trans_type) is not None
+
+
+@lru_cache(maxsize=1024)
+def _ibi_is_sell(trans_type: str) -> bool:
+    """IBI sell check on a stripped transaction type (memoized)."""
+    if _IBI_SELL_EXCLUDE_RE.search(trans_type):
+        return False
+
+    return _IBI_SELL_TYPES_RE.search(trans_type) is not None
+
+
+@lru_cache(maxsize=1024)
+def _ibi_is_dividend(trans_type: str) -> bool:
+    """IBI dividend check on a stripped transaction type (memoized)."""
+    return _IBI_DIVIDEND_TYPES_RE.search(trans_type) is not None
+
+
+@lru_cache(maxsize=1024)
+def _ibi_is_fee(trans_type: str) -> bool:
+    """IBI fee check on a stripped transaction type (memoized)."""
+    return _IBI_FEE_TYPES_RE.search(trans_type) is not None
+
+
+@lru_cache(maxsize=1024)
+def _ibi_is_tax(trans_type: str) -> bool:
+    """IBI tax check on a stripped transaction type (memoized)."""
+    # Check for tax patterns
+    return _IBI_TAX_TYPES_RE.search(trans_type) is not None
+
+
+@lru_cache(maxsize=1024)
+def _ibi_is_interest(trans_type: str) -> bool:
+    """IBI interest check on a stripped transaction type (memoized)."""
+    return _IBI_INTEREST_TYPES_RE.search(trans_type) is not None
+
+
+@lru_cache(maxsize=1024)
+def _ibi_is_cash_transfer(trans_type: str) -> bool:
+    """IBI cash transfer check on a stripped transaction type (memoized)."""
+    return _IBI_TRANSFER_TYPES_RE.search(trans_type) is not None
+
+
 class IBITransactionClassifier(TransactionClassifier):
     """
     IBI Broker transaction classification logic.
@@ -140,47 +313,7 @@ class IBITransactionClassifier(TransactionClassifier):
         - Tax withdrawals (cash only)
         - Interest payments (cash only)
         """
-        trans_type = transaction_type.strip()
-
-        # Explicitly exclude dividend deposits and cash transactions
-        # These are cash flows, not share additions
-        exclude_types = [
-            'דיבידנד',        # Dividend (cash)
-            'דיב',             # Dividend abbreviation
-            'משיכת מס',       # Tax withdrawal (cash)
-            'ריבית',          # Interest (cash)
-            'העברה מזומן',    # Cash transfer
-            'דמי טפול'        # Handling fee
-        ]
-
-        if any(exclude in trans_type for exclude in exclude_types):
-            return False
-
-        # Buy transactions - add shares to position
-        buy_types = [
-            # Regular purchases (all variations)
-            'קניה שח',        # NIS buy
-            'קניה מטח',       # Foreign currency buy
-            'קניה חול מטח',   # Foreign currency buy (abroad)
-            'קניה רצף',       # Continuous buy
-            'קניה מעוף',      # Immediate execution buy
-
-            # Deposits - shares transferred into account
-            'הפקדה',          # Deposit (general)
-            'הפקדה פקיעה',    # Expiration deposit (e.g., option exercise)
-
-            # Benefits/bonuses - shares received as benefit
-            'הטבה',           # Benefit/bonus shares
-
-            # Stock splits and dividends (if they add shares, not cash)
-            'פיצול',          # Stock split
-            'דיבידנד מניות',  # Stock dividend (shares, not cash)
-
-            # English equivalents
-            'Buy', 'Deposit', 'Benefit', 'Split'
-        ]
-
-        return any(buy_type in trans_type for buy_type in buy_types)
+        return _ibi_is_buy(transaction_type.strip())
 
     def is_sell(self, transaction_type: str, **kwargs) -> bool:
         """
@@ -197,41 +330,7 @@ class IBITransactionClassifier(TransactionClassifier):
         - Interest withdrawals (cash only)
         - Cash transfers and fees
         """
-        trans_type = transaction_type.strip()
-
-        # Explicitly exclude cash-only transactions
-        # These withdraw cash but don't remove shares
-        exclude_types = [
-            'דיבידנד',        # Dividend (cash)
-            'דיב',             # Dividend abbreviation
-            'משיכת מס',       # Tax withdrawal (cash only)
-            'משיכת ריבית',    # Interest withdrawal (cash)
-            'העברה מזומן',    # Cash transfer
-            'דמי טפול',       # Handling fee
-            'ריבית מזומן'     # Cash interest
-        ]
-
-        if any(exclude in trans_type for exclude in exclude_types):
-            return False
-
-        # Sell transactions - remove shares from position
-        sell_types = [
-            # Regular sales (all variations)
-            'מכירה שח',       # NIS sell
-            'מכירה מטח',      # Foreign currency sell
-            'מכירה חול מטח',  # Foreign currency sell (abroad)
-            'מכירה רצף',      # Continuous sell
-            'מכירה מעוף',     # Immediate execution sell
-
-            # Withdrawals - shares transferred out of account
-            'משיכה',          # Withdrawal (general)
-            'משיכה פקיעה',    # Expiration withdrawal
-
-            # English equivalents
-            'Sell', 'Withdrawal'
-        ]
-
-        return any(sell_type in trans_type for sell_type in sell_types)
+        return _ibi_is_sell(transaction_type.strip())
 
     def is_dividend(self, transaction_type: str, **kwargs) -> bool:
         """
@@ -241,14 +340,7 @@ class IBITransactionClassifier(TransactionClassifier):
         - Regular dividends
         - Dividend deposits in foreign currency
         """
-        trans_type = transaction_type.strip()
-        dividend_types = [
-            'דיבידנד',                 # Dividend (general)
-            'דיב',                      # Dividend abbreviation
-            'הפקדה דיבידנד',          # Dividend deposit
-            'Dividend'                  # English
-        ]
-        return any(div_type in trans_type for div_type in dividend_types)
+        return _ibi_is_dividend(transaction_type.strip())
 
     def is_fee(self, transaction_type: str, **kwargs) -> bool:
         """
@@ -258,14 +350,7 @@ class IBITransactionClassifier(TransactionClassifier):
         - Transaction fees (עמלה)
         - Handling fees (דמי טפול)
         """
-        trans_type = transaction_type.strip()
-        fee_types = [
-            'עמלה',            # Fee/commission
-            'דמי טפול',        # Handling fee
-            'דמי ניהול',       # Management fee
-            'Fee'              # English
-        ]
-        return any(fee_type in trans_type for fee_type in fee_types)
+        return _ibi_is_fee(transaction_type.strip())
 
     def is_tax(self, transaction_type: str, **kwargs) -> bool:
         """
@@ -276,13 +361,7 @@ class IBITransactionClassifier(TransactionClassifier):
         - Tax payments
         - Capital gains tax
         """
-        trans_type = transaction_type.strip()
-        tax_types = [
-            'משיכת מס',       # Tax withdrawal (check this first - more specific)
-            'Tax'              # English
-        ]
-        # Check for tax patterns
-        return any(tax_type in trans_type for tax_type in tax_types)
+        return _ibi_is_tax(transaction_type.strip())
 
     def is_interest(self, transaction_type: str, **kwargs) -> bool:
         """
@@ -292,13 +371,7 @@ class IBITransactionClassifier(TransactionClassifier):
         - Interest on cash balances
         - Interest withdrawals
         """
-        trans_type = transaction_type.strip()
-        interest_types = [
-            'ריבית',           # Interest
-            'משיכת ריבית',    # Interest withdrawal
-            'Interest'         # English
-        ]
-        return any(int_type in trans_type for int_type in interest_types)
+        return _ibi_is_interest(transaction_type.strip())
 
     def is_cash_transfer(self, transaction_type: str, **kwargs) -> bool:
         """
@@ -309,13 +382,7 @@ class IBITransactionClassifier(TransactionClassifier):
         - Cash withdrawals
         - Internal transfers
         """
-        trans_type = transaction_type.strip()
-        transfer_types = [
-            'העברה מזומן',     # Cash transfer
-            'העברה',           # Transfer (general)
-            'Transfer'         # English
-        ]
-        return any(transfer_type in trans_type for transfer_type in transfer_types)
+        return _ibi_is_cash_transfer(transaction_type.strip())
 
 
 class ClassifierFactory:
@@ -328,11 +395,17 @@ class ClassifierFactory:
         'ibi': IBITransactionClassifier,
     }
 
+    # Classifiers are stateless, so one instance per broker is shared
+    _instances: Dict[str, TransactionClassifier] = {}
+
     @classmethod
     def get_classifier(cls, broker: str) -> TransactionClassifier:
         """
         Get classifier instance for specified broker.
 
+        Instances are cached per broker; Transaction properties call this on
+        every access, so reusing them avoids an allocation per check.
+
         Args:
             broker: Broker name (e.g., 'IBI', 'ibi')
 
@@ -342,6 +415,10 @@ class ClassifierFactory:
         Raises:
             ValueError: If broker not supported
         """
+        classifier = cls._instances.get(broker)
+        if classifier is not None:
+            return classifier
+
         classifier_class = cls._classifiers.get(broker)
 
         if not classifier_class:
@@ -350,7 +427,8 @@ class ClassifierFactory:
                 f"Supported brokers: {list(cls._classifiers.keys())}"
             )
 
-        return classifier_class()
+        classifier = cls._instances[broker] = classifier_class()
+        return classifier
 
     @classmethod
     def register_classifier(cls, broker: str, classifier_class: type):
@@ -368,6 +446,7 @@ class ClassifierFactory:
             )
 
         cls._classifiers[broker] = classifier_class
+        cls._instances.pop(broker, None)
 
     @classmethod
     def get_supported_brokers(cls) -> list:
@@ -6,6 +6,7 @@ Uses REAL transaction data to calculate actual holdings.
 """
 
 import logging
+from operator import attrgetter
 from typing import List, Dict, Optional
 from src.models.transaction import Transaction
 from .position import Position
@@ -22,6 +23,9 @@ from .errors import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# IBI internal accounting entries (tax tracking etc.) use the 999xxxx series
+PHANTOM_SYMBOL_PREFIX = '999'
+
 
 class PortfolioBuilder:
     """
@@ -70,7 +74,7 @@ class PortfolioBuilder:
 
         try:
             # 1. Sort transactions by date (oldest first) - CRITICAL for correct calculations
-            sorted_txs = sorted(transactions, key=lambda t: t.date)
+            sorted_txs = sorted(transactions, key=attrgetter('date'))
         except (AttributeError, TypeError) as e:
             error = TransactionProcessingError(
                 "Failed to sort transactions by date. Check date fields.",
@@ -185,9 +189,8 @@ class PortfolioBuilder:
         """
         symbol = tx.security_symbol
 
-        # Skip phantom/tax tracking securities (999xxxx series)
-        # These are IBI internal accounting entries, not actual holdings
-        if symbol.startswith('999'):
+        # Skip phantom/tax tracking securities - not actual holdings
+        if self._is_phantom_security(symbol):
             return
 
         # Get existing position or create new one
@@ -210,6 +213,15 @@ class PortfolioBuilder:
             self._process_sell(position, tx)
         # Ignore dividends, fees, taxes for now (don't affect holdings)
 
+    @staticmethod
+    def _is_phantom_security(symbol: str) -> bool:
+        """
+        Check if a symbol is an IBI phantom/tax tracking security (999xxxx series).
+
+        These are internal accounting entries, not actual holdings.
+        """
+        return symbol.startswith(PHANTOM_SYMBOL_PREFIX)
+
     def _process_buy(self, position: Position, tx: Transaction):
         """
         Add shares to position from actual buy transaction.
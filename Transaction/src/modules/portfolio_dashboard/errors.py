@@ -5,6 +5,7 @@ Defines custom exception classes and error handling utilities for the portfolio
 building process, providing clear error messages and error recovery strategies.
 """
 
+from collections import Counter
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -188,10 +189,7 @@ class ErrorCollector:
         Returns:
             Dictionary with error statistics and details
         """
-        error_types = {}
-        for error in self.errors:
-            error_type = error.__class__.__name__
-            error_types[error_type] = error_types.get(error_type, 0) + 1
+        error_types = dict(Counter(error.__class__.__name__ for error in self.errors))
 
         return {
             "total_errors": self.get_error_count(),
@@ -221,6 +219,17 @@ class ErrorCollector:
             )
 
 
+# Currencies accepted by validate_transaction_data
+VALID_CURRENCIES = frozenset({"₪", "$", "€", "£"})
+
+# Numeric Transaction fields that must be finite
+NUMERIC_FIELDS = (
+    'quantity', 'execution_price', 'transaction_fee',
+    'additional_fees', 'amount_foreign_currency',
+    'amount_local_currency', 'balance'
+)
+
+
 def validate_transaction_data(transaction) -> List[str]:
     """
     Validate transaction data quality.
@@ -249,18 +258,11 @@ def validate_transaction_data(transaction) -> List[str]:
         errors.append(f"Invalid date type: {type(transaction.date)}")
 
     # Check currency validity
-    valid_currencies = ["₪", "$", "€", "£"]
-    if transaction.currency not in valid_currencies:
+    if transaction.currency not in VALID_CURRENCIES:
         errors.append(f"Invalid currency: {transaction.currency}")
 
     # Check for NaN or infinite values in numeric fields
-    numeric_fields = [
-        'quantity', 'execution_price', 'transaction_fee',
-        'additional_fees', 'amount_foreign_currency',
-        'amount_local_currency', 'balance'
-    ]
-
-    for field in numeric_fields:
+    for field in NUMERIC_FIELDS:
         value = getattr(transaction, field, 0)
         if value is None or (isinstance(value, float) and (value != value or abs(value) == float('inf'))):
             errors.append(f"Invalid value for {field}: {value}")
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Current holding position for one security.
@@ -24,6 +24,10 @@ class Position:
     - current_price: Current market price per share
     - market_value: Current market value (quantity * current_price)
     - source: Data source ('calculated' | 'actual' | 'merged')
+
+    Uses __slots__: portfolios hold one Position per security and their
+    fields are read on every dashboard render, so instances stay compact
+    and attribute access skips the instance dict.
     """
 
     security_name: str
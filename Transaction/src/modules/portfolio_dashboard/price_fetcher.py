@@ -10,10 +10,13 @@ Implements robust API calls with:
 """
 
 import yfinance as yf
+import pandas as pd
 from typing import Dict, Optional, List
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
 
 
@@ -28,6 +31,7 @@ INITIAL_RETRY_DELAY = 1.0  # seconds
 MAX_RETRY_DELAY = 10.0  # seconds
 REQUEST_TIMEOUT = 10  # seconds
 RATE_LIMIT_DELAY = 0.5  # seconds between requests
+MAX_FETCH_WORKERS = 4  # concurrent per-symbol fallback fetches
 
 
 class PriceFetchError(Exception):
@@ -137,6 +141,65 @@ def fetch_current_price(symbol: str, currency: str = "$") -> Optional[float]:
         raise  # Re-raise for retry decorator
 
 
+def _download_closing_prices(symbols: List[str]) -> Optional[Dict[str, Optional[float]]]:
+    """
+    Download latest closing prices for several symbols in one request.
+
+    Uses yf.download for the whole batch instead of one Ticker.history call
+    per symbol. Symbols missing from the response (unknown, delisted, or a
+    partial failure) map to None so the caller can fall back to fetching
+    them individually.
+
+    Args:
+        symbols: List of stock ticker symbols
+
+    Returns:
+        Dictionary mapping symbol to price (or None if not in the response),
+        or None if the download failed or returned no data at all
+    """
+    prices = {symbol: None for symbol in symbols}
+
+    try:
+        data = yf.download(
+            tickers=symbols,
+            period="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            timeout=REQUEST_TIMEOUT
+        )
+    except Exception as e:
+        logger.warning(f"Batch download failed: {e}")
+        return None
+
+    if data is None or data.empty:
+        logger.warning("Batch download returned no data")
+        return None
+
+    for symbol in symbols:
+        try:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                closes = data[symbol]["Close"]
+            elif len(symbols) == 1:
+                closes = data["Close"]
+            else:
+                continue
+
+            closes = closes.dropna()
+            if closes.empty:
+                continue
+
+            close_price = float(closes.iloc[-1])
+            if close_price > 0:
+                prices[symbol] = close_price
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"No batch price for {symbol}: {e}")
+
+    return prices
+
+
 @st.cache_data(ttl=CACHE_TTL)
 def fetch_multiple_prices_batch(
     symbols: List[str],
@@ -146,6 +209,11 @@ def fetch_multiple_prices_batch(
     """
     Fetch prices for multiple symbols with rate limiting and progress tracking.
 
+    All symbols are requested in a single batch download; only symbols the
+    batch did not return are fetched individually, on a small thread pool.
+    If the batch download fails outright the price service is treated as
+    unavailable and no per-symbol fetches are attempted.
+
     Args:
         symbols: List of stock ticker symbols
         currency: Currency for all symbols
@@ -153,9 +221,10 @@ def fetch_multiple_prices_batch(
 
     Returns:
         Dictionary mapping symbol to price (or None if fetch failed)
-    """
-    prices = {}
 
+    Raises:
+        PriceFetchError: If the batch download failed (e.g. offline)
+    """
     # Skip if empty or NIS
     if not symbols or currency == "₪":
         return {symbol: None for symbol in symbols}
@@ -163,28 +232,56 @@ def fetch_multiple_prices_batch(
     total = len(symbols)
     logger.info(f"Fetching prices for {total} {currency} symbols")
 
-    for i, symbol in enumerate(symbols):
-        # Rate limiting delay (except first request)
-        if i > 0:
-            time.sleep(RATE_LIMIT_DELAY)
+    # One round-trip for the whole batch
+    prices = _download_closing_prices(symbols)
+    if prices is None:
+        # Raised rather than returned so st.cache_data does not memoize the
+        # outage for the whole cache TTL
+        raise PriceFetchError("Price service unavailable")
+    missing = [symbol for symbol in symbols if prices.get(symbol) is None]
 
-        # Fetch price
-        try:
-            price = fetch_current_price(symbol, currency)
-            prices[symbol] = price
+    if progress_callback:
+        progress_callback((total - len(missing)) / total)
 
-            if price:
-                logger.debug(f"✓ {symbol}: ${price:.2f}")
-            else:
-                logger.debug(f"✗ {symbol}: No price")
+    if missing:
+        logger.info(f"Batch download missed {len(missing)} symbols, fetching individually")
 
+    def fetch_one(symbol: str) -> Optional[float]:
+        try:
+            return fetch_current_price(symbol, currency)
         except Exception as e:
             logger.error(f"Error fetching {symbol}: {e}")
-            prices[symbol] = None
+            return None
 
-        # Update progress
-        if progress_callback:
-            progress_callback((i + 1) / total)
+    # Fetch the leftovers on a small pool. Requests still start at most one
+    # per RATE_LIMIT_DELAY, as in the old sequential loop; the pool only lets
+    # a slow response overlap the next request. Workers get the script's run
+    # context so the cached fetch_current_price works there.
+    if missing:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_FETCH_WORKERS, len(missing)),
+            initializer=add_script_run_ctx,
+            initargs=(None, get_script_run_ctx())
+        ) as executor:
+            futures = {}
+            for i, symbol in enumerate(missing):
+                if i:
+                    time.sleep(RATE_LIMIT_DELAY)
+                futures[executor.submit(fetch_one, symbol)] = symbol
+
+            for done, future in enumerate(as_completed(futures), 1):
+                symbol = futures[future]
+                price = future.result()
+                prices[symbol] = price
+
+                if price:
+                    logger.debug(f"✓ {symbol}: ${price:.2f}")
+                else:
+                    logger.debug(f"✗ {symbol}: No price")
+
+                # Update progress
+                if progress_callback:
+                    progress_callback((total - len(missing) + done) / total)
 
     # Log summary
     successful = sum(1 for p in prices.values() if p is not None)
@@ -209,9 +306,16 @@ def fetch_multiple_prices(positions: list) -> Dict[str, Optional[float]]:
 
     prices = {}
 
-    # Group positions by currency
-    usd_symbols = [pos.security_symbol for pos in positions if pos.currency == "$"]
-    nis_symbols = [pos.security_symbol for pos in positions if pos.currency == "₪"]
+    # Group positions by currency in one pass (dict keys keep order and
+    # drop duplicate symbols so each one is requested once)
+    symbols_by_currency = {"$": {}, "₪": {}}
+    for pos in positions:
+        bucket = symbols_by_currency.get(pos.currency)
+        if bucket is not None:
+            bucket[pos.security_symbol] = None
+
+    usd_symbols = list(symbols_by_currency["$"])
+    nis_symbols = list(symbols_by_currency["₪"])
 
     # Fetch USD prices
     if usd_symbols:
@@ -232,6 +336,9 @@ def update_positions_with_prices(positions: list) -> list:
     """
     Update position objects with current market prices.
 
+    Shows a warning in the app when the price service cannot be reached;
+    positions then keep current_price and market_value as None.
+
     Args:
         positions: List of Position objects
 
@@ -257,6 +364,9 @@ def update_positions_with_prices(positions: list) -> list:
 
         logger.info(f"Updated {updated_count}/{len(positions)} positions with current prices")
 
+    except PriceFetchError as e:
+        logger.warning(f"Skipping price update: {e}")
+        st.warning("Current prices are unavailable - the price service could not be reached.")
     except Exception as e:
         logger.error(f"Error updating positions with prices: {e}")
         # Don't fail - just leave prices as None
@@ -287,5 +397,6 @@ def get_cache_status() -> Dict[str, any]:
         "cache_ttl_minutes": CACHE_TTL / 60,
         "max_retries": MAX_RETRIES,
         "rate_limit_delay_seconds": RATE_LIMIT_DELAY,
+        "max_fetch_workers": MAX_FETCH_WORKERS,
         "request_timeout_seconds": REQUEST_TIMEOUT
     }
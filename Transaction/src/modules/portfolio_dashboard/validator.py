@@ -371,6 +371,13 @@ class PortfolioValidator:
         Returns:
             Formatted text report
         """
+        # Group discrepancies by severity in one pass (used for counts and details)
+        severities = ('critical', 'high', 'medium', 'low')
+        by_severity = {severity: [] for severity in severities}
+        for d in result.discrepancies:
+            if d.severity in by_severity:
+                by_severity[d.severity].append(d)
+
         lines = []
         lines.append("=" * 80)
         lines.append("PORTFOLIO VALIDATION REPORT")
@@ -385,10 +392,10 @@ class PortfolioValidator:
         lines.append(f"Total Actual Positions: {result.total_positions_actual}")
         lines.append(f"Matched Positions: {result.matched_positions}")
         lines.append(f"Discrepancies Found: {len(result.discrepancies)}")
-        lines.append(f"  - Critical: {len([d for d in result.discrepancies if d.severity == 'critical'])}")
-        lines.append(f"  - High: {len([d for d in result.discrepancies if d.severity == 'high'])}")
-        lines.append(f"  - Medium: {len([d for d in result.discrepancies if d.severity == 'medium'])}")
-        lines.append(f"  - Low: {len([d for d in result.discrepancies if d.severity == 'low'])}")
+        lines.extend(
+            f"  - {severity.capitalize()}: {len(by_severity[severity])}"
+            for severity in severities
+        )
         lines.append("")
         lines.append(result.summary)
         lines.append("")
@@ -398,9 +405,8 @@ class PortfolioValidator:
             lines.append("DISCREPANCIES")
             lines.append("-" * 80)
 
-            # Group by severity
-            for severity in ['critical', 'high', 'medium', 'low']:
-                severity_discreps = [d for d in result.discrepancies if d.severity == severity]
+            for severity in severities:
+                severity_discreps = by_severity[severity]
                 if severity_discreps:
                     lines.append("")
                     lines.append(f"{severity.upper()} ({len(severity_discreps)}):")
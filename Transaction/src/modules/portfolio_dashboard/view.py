@@ -7,10 +7,53 @@ Displays ACTUAL values from real transaction data.
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 from typing import List, Dict, Optional
 from .position import Position
 from .validator import PortfolioValidator, ValidationResult
 
+# Discrepancy severity levels, most severe first
+SEVERITY_LEVELS = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+
+# Export columns, matching the keys produced by Position.to_dict()
+EXPORT_BASE_COLUMNS = (
+    'security_name', 'security_symbol', 'quantity', 'average_cost',
+    'total_invested', 'currency', 'source',
+)
+EXPORT_MARKET_COLUMNS = ('current_price', 'market_value', 'unrealized_pnl', 'unrealized_pnl_pct')
+
+
+def _total_invested(positions: List[Position]) -> float:
+    """Sum cost basis across positions with a single numpy reduction."""
+    return float(np.fromiter(
+        (pos.total_invested for pos in positions),
+        dtype=np.float64, count=len(positions)
+    ).sum())
+
+
+def _positions_to_dataframe(positions: List[Position]) -> pd.DataFrame:
+    """
+    Build the export DataFrame column by column.
+
+    Same layout as pd.DataFrame([pos.to_dict() ...]) without building a
+    dict per position: market columns are only added when at least one
+    position has market data, and are empty for positions without it.
+    """
+    data = {
+        col: [getattr(pos, col) for pos in positions]
+        for col in EXPORT_BASE_COLUMNS
+    }
+
+    has_market = [pos.has_market_data for pos in positions]
+    if any(has_market):
+        for col in EXPORT_MARKET_COLUMNS:
+            data[col] = [
+                getattr(pos, col) if flag else None
+                for pos, flag in zip(positions, has_market)
+            ]
+
+    return pd.DataFrame(data)
+
 
 def display_portfolio(positions: List[Position]):
     """
@@ -66,7 +109,7 @@ def display_portfolio(positions: List[Position]):
 
     with col2:
         # Calculate total invested across all positions
-        total_invested = sum(pos.total_invested for pos in positions)
+        total_invested = _total_invested(positions)
         st.metric("Total Invested", f"₪{total_invested:,.2f}")
 
     with col3:
@@ -88,8 +131,7 @@ def export_portfolio_to_excel(positions: List[Position]):
         positions: List of Position objects
     """
     # Create DataFrame
-    data = [pos.to_dict() for pos in positions]
-    df = pd.DataFrame(data)
+    df = _positions_to_dataframe(positions)
 
     # Convert to Excel in memory
     from io import BytesIO
@@ -137,6 +179,13 @@ def display_portfolio_by_currency(positions_by_currency: Dict[str, List[Position
     total_positions = sum(len(positions) for positions in positions_by_currency.values())
     total_currencies = len(positions_by_currency)
 
+    # Cost basis per currency - computed once and reused by the summary
+    # metrics and the per-currency sections below
+    total_invested_by_curr = {
+        currency: _total_invested(positions)
+        for currency, positions in positions_by_currency.items()
+    }
+
     # Calculate totals by currency
     col1, col2, col3 = st.columns(3)
 
@@ -146,11 +195,6 @@ def display_portfolio_by_currency(positions_by_currency: Dict[str, List[Position
         st.metric("Currencies", total_currencies)
 
     with col3:
-        # Calculate total cost basis with proper currency conversion
-        total_invested_by_curr = {}
-        for currency, positions in positions_by_currency.items():
-            total_invested_by_curr[currency] = sum(pos.total_invested for pos in positions)
-
         # Convert all to NIS for total
         total_in_nis = 0.0
         if "₪" in total_invested_by_curr:
@@ -232,7 +276,7 @@ def display_portfolio_by_currency(positions_by_currency: Dict[str, List[Position
         )
 
         # Currency-specific totals
-        total_invested = sum(pos.total_invested for pos in positions)
+        total_invested = total_invested_by_curr[currency]
         num_positions = len(positions)
 
         if has_any_market_data and show_market_data:
@@ -246,8 +290,17 @@ def display_portfolio_by_currency(positions_by_currency: Dict[str, List[Position
             st.metric(f"{currency} Cost Basis", f"{currency}{total_invested:,.2f}")
 
         if has_any_market_data and show_market_data:
-            total_market_val = sum(pos.market_value for pos in positions if pos.market_value is not None)
-            total_pnl = sum(pos.unrealized_pnl for pos in positions if pos.unrealized_pnl is not None)
+            # Missing market data becomes NaN so nansum skips it
+            market_vals = np.fromiter(
+                (np.nan if pos.market_value is None else pos.market_value for pos in positions),
+                dtype=np.float64, count=num_positions
+            )
+            pnl_vals = np.fromiter(
+                (np.nan if pos.unrealized_pnl is None else pos.unrealized_pnl for pos in positions),
+                dtype=np.float64, count=num_positions
+            )
+            total_market_val = float(np.nansum(market_vals))
+            total_pnl = float(np.nansum(pnl_vals))
             total_pnl_pct = (total_pnl / total_invested * 100) if total_invested > 0 else 0
 
             with col3:
@@ -353,12 +406,18 @@ def display_validation_results(
                 # Add severity-based filtering
                 severity_filter = st.multiselect(
                     "Filter by Severity",
-                    options=["CRITICAL", "HIGH", "MEDIUM", "LOW"],
+                    options=list(SEVERITY_LEVELS),
                     default=["CRITICAL", "HIGH"]
                 )
 
+                # One boolean mask per severity, OR-ed for the current selection
+                severity_col = df["Severity"].to_numpy()
+                severity_masks = {sev: severity_col == sev for sev in SEVERITY_LEVELS}
+
                 if severity_filter:
-                    df_filtered = df[df["Severity"].isin(severity_filter)]
+                    df_filtered = df[np.logical_or.reduce(
+                        [severity_masks[sev] for sev in severity_filter]
+                    )]
                 else:
                     df_filtered = df
 
@@ -438,8 +497,7 @@ def export_currency_portfolios_to_excel(positions_by_currency: Dict[str, List[Po
     with pd.ExcelWriter(output, engine='openpyxl') as writer:
         # Create a sheet for each currency
         for currency, positions in positions_by_currency.items():
-            data = [pos.to_dict() for pos in positions]
-            df = pd.DataFrame(data)
+            df = _positions_to_dataframe(positions)
 
             sheet_name = "NIS_Portfolio" if currency == "₪" else "USD_Portfolio" if currency == "$" else f"{currency}_Portfolio"
             df.to_excel(writer, sheet_name=sheet_name, index=False)
@@ -447,7 +505,7 @@ def export_currency_portfolios_to_excel(positions_by_currency: Dict[str, List[Po
         # Create a summary sheet
         summary_data = []
         for currency, positions in positions_by_currency.items():
-            total_invested = sum(pos.total_invested for pos in positions)
+            total_invested = _total_invested(positions)
             summary_data.append({
                 "Currency": currency,
                 "Positions": len(positions),
@@ -0,0 +1,94 @@
+"""
+Unit tests for ActualPortfolioAdapter.
+
+Tests filtering and derived columns of the broker holdings file.
+"""
+
+import pandas as pd
+import pytest
+from src.adapters.actual_portfolio_adapter import ActualPortfolioAdapter
+
+
+@pytest.fixture
+def adapter():
+    """Get actual portfolio adapter instance."""
+    return ActualPortfolioAdapter()
+
+
+@pytest.fixture
+def raw_df(adapter):
+    """Raw holdings DataFrame with Hebrew column names."""
+    mapping = adapter.get_column_mapping()
+    data = {
+        'security_name': ['APPLE', 'טבע', 'אופציה', 'מס לשלם'],
+        'security_number': ['1001', '629014', '2002', '3003'],
+        'security_symbol': ['AAPL', ' ', 'OPT', 'TAX'],
+        'security_type': ['מניה', 'מניה', 'אופציית רכש', 'מניה'],
+        'currency': ['דולר אמריקאי', 'שקל חדש', 'שקל חדש', 'שקל חדש'],
+        'quantity': [10, 4, 1, 5],
+        'cost_basis': [1500.0, 200.0, 10.0, 0.0],
+        'market_value': [1800.0, 220.0, 12.0, 0.0],
+        'current_price': [180.0, 55.0, 12.0, 0.0],
+        'total_pnl': [300.0, 20.0, 2.0, 0.0],
+        'daily_pnl': [5.0, 1.0, 0.0, 0.0],
+    }
+    return pd.DataFrame({mapping[key]: values for key, values in data.items()})
+
+
+class TestActualPortfolioAdapterTransform:
+    """Test ActualPortfolioAdapter.transform."""
+
+    def test_filters_derivatives_and_tax_entries(self, adapter, raw_df):
+        """Test options and tax rows are dropped."""
+        df = adapter.transform(raw_df)
+
+        assert df['security_name'].tolist() == ['APPLE', 'טבע']
+        assert df['currency'].tolist() == ['$', '₪']
+
+    def test_symbol_falls_back_to_security_number(self, adapter, raw_df):
+        """Test blank symbols are replaced by the security number."""
+        df = adapter.transform(raw_df)
+
+        assert df['symbol_clean'].tolist() == ['AAPL', '629014']
+
+    def test_average_cost(self, adapter, raw_df):
+        """Test average cost is cost basis per share."""
+        df = adapter.transform(raw_df)
+
+        assert df['avg_cost'].tolist() == [150.0, 50.0]
+
+
+class TestActualPortfolioSummary:
+    """Test ActualPortfolioAdapter.get_summary_stats."""
+
+    def test_totals_by_currency(self, adapter, raw_df):
+        """Test per-currency totals over transformed positions."""
+        stats = adapter.get_summary_stats(adapter.transform(raw_df))
+
+        assert stats['total_positions'] == 2
+        assert stats['currencies'] == ['$', '₪']
+        assert stats['by_currency']['$'] == {
+            'total_positions': 1,
+            'total_market_value': 1800.0,
+            'total_cost_basis': 1500.0,
+            'total_unrealized_pnl': 300.0,
+            'total_daily_pnl': 5.0,
+        }
+        assert stats['by_currency']['₪']['total_market_value'] == 220.0
+
+    def test_missing_currency_is_kept(self, adapter):
+        """Test positions without a currency still get their own totals."""
+        df = pd.DataFrame({
+            'currency': ['$', None],
+            'market_value': [100.0, 40.0],
+            'cost_basis': [90.0, 30.0],
+            'total_pnl': [10.0, 10.0],
+            'daily_pnl': [1.0, 2.0],
+        })
+
+        stats = adapter.get_summary_stats(df)
+
+        assert len(stats['by_currency']) == 2
+        missing = next(v for k, v in stats['by_currency'].items() if pd.isna(k))
+        assert missing['total_positions'] == 1
+        assert missing['total_market_value'] == 40.0
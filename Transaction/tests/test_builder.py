@@ -0,0 +1,63 @@
+"""
+Unit tests for PortfolioBuilder.
+
+Tests position calculation from transaction history.
+"""
+
+import pytest
+from datetime import datetime
+from src.models.transaction import Transaction
+from src.modules.portfolio_dashboard.builder import PortfolioBuilder
+
+
+def make_tx(day, trans_type, symbol, quantity, price, currency='$'):
+    """Create a transaction with the fields the builder uses."""
+    return Transaction(
+        date=datetime(2024, 1, day),
+        transaction_type=trans_type,
+        security_name=f"Security {symbol}",
+        security_symbol=symbol,
+        quantity=quantity,
+        execution_price=price,
+        currency=currency,
+        amount_foreign_currency=-quantity * price,
+        balance=0.0
+    )
+
+
+class TestPortfolioBuilder:
+    """Test PortfolioBuilder.build."""
+
+    def test_weighted_average_cost(self):
+        """Test buys average their cost and sells reduce quantity."""
+        positions = PortfolioBuilder().build([
+            make_tx(3, 'מכירה שח', 'AAPL', 5, 200.0),
+            make_tx(1, 'קניה שח', 'AAPL', 10, 100.0),
+            make_tx(2, 'קניה שח', 'AAPL', 10, 200.0),
+        ])
+
+        assert len(positions) == 1
+        assert positions[0].quantity == 15
+        assert positions[0].average_cost == pytest.approx(150.0)
+
+    def test_phantom_securities_skipped(self):
+        """Test 999xxxx tax tracking entries never become positions."""
+        positions = PortfolioBuilder().build([
+            make_tx(1, 'קניה שח', '9992975', 100, 1.0, '₪'),
+            make_tx(1, 'קניה שח', 'MSFT', 2, 300.0),
+        ])
+
+        assert [p.security_symbol for p in positions] == ['MSFT']
+
+    def test_is_phantom_security(self):
+        """Test phantom symbol detection."""
+        assert PortfolioBuilder._is_phantom_security('9993983')
+        assert not PortfolioBuilder._is_phantom_security('629014')
+
+    def test_invalid_currency_collected_as_error(self):
+        """Test transactions with unknown currencies are skipped and reported."""
+        builder = PortfolioBuilder()
+        positions = builder.build([make_tx(1, 'קניה שח', 'AAPL', 1, 100.0, 'XYZ')])
+
+        assert positions == []
+        assert builder.get_error_summary()['total_errors'] == 1
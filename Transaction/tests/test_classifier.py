@@ -183,6 +183,10 @@ class TestClassifierFactory:
         classifier = ClassifierFactory.get_classifier('ibi')
         assert isinstance(classifier, IBITransactionClassifier)
 
+    def test_classifier_instance_is_reused(self):
+        """Test that repeated lookups return the same cached instance."""
+        assert ClassifierFactory.get_classifier('IBI') is ClassifierFactory.get_classifier('IBI')
+
     def test_unsupported_broker_raises_error(self):
         """Test that unsupported broker raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
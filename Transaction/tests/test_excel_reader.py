@@ -0,0 +1,64 @@
+"""
+Unit tests for ExcelReader.
+
+Covers the optional on-disk cache of parsed sheets.
+"""
+
+import os
+import pandas as pd
+import pytest
+from src.input.excel_reader import ExcelReader
+
+
+@pytest.fixture
+def excel_file(tmp_path):
+    """Write a small Excel file and return its path."""
+    path = tmp_path / "trans.xlsx"
+    pd.DataFrame({'סוג פעולה': ['קניה שח', 'מכירה שח'], 'כמות': [10, 5]}).to_excel(path, index=False)
+    return path
+
+
+class TestExcelReaderCache:
+    """Test parsed-sheet caching."""
+
+    def test_no_cache_by_default(self, excel_file, tmp_path):
+        """Test that nothing is written when cache_dir is not set."""
+        df = ExcelReader().read(str(excel_file))
+
+        assert len(df) == 2
+        assert not list(tmp_path.glob("*.pkl"))
+
+    def test_cached_read_matches_source(self, excel_file, tmp_path):
+        """Test that a cached read returns the same data as the original parse."""
+        cache_dir = tmp_path / "cache"
+        reader = ExcelReader(cache_dir=str(cache_dir))
+
+        first = reader.read(str(excel_file))
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+        second = reader.read(str(excel_file))
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_cache_invalidated_when_file_changes(self, excel_file, tmp_path):
+        """Test that modifying the source file bypasses the old cache entry."""
+        reader = ExcelReader(cache_dir=str(tmp_path / "cache"))
+        reader.read(str(excel_file))
+
+        pd.DataFrame({'סוג פעולה': ['דיבידנד'], 'כמות': [0]}).to_excel(excel_file, index=False)
+        stat = excel_file.stat()
+        os.utime(excel_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        df = reader.read(str(excel_file))
+        assert df['סוג פעולה'].tolist() == ['דיבידנד']
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    def test_corrupt_cache_entry_is_reparsed(self, excel_file, tmp_path):
+        """Test that an unreadable cache entry falls back to parsing the file."""
+        cache_dir = tmp_path / "cache"
+        reader = ExcelReader(cache_dir=str(cache_dir))
+        reader.read(str(excel_file))
+
+        cache_file, = cache_dir.glob("*.pkl")
+        cache_file.write_bytes(b"not a pickle")
+
+        assert len(reader.read(str(excel_file))) == 2
@@ -0,0 +1,46 @@
+"""
+Unit tests for FileDiscovery.
+
+Covers Excel file scanning and its directory-mtime cache.
+"""
+
+import os
+import pytest
+from src.input.file_discovery import FileDiscovery
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Create a data directory with a couple of files."""
+    (tmp_path / "IBI trans 2024.xlsx").touch()
+    (tmp_path / "old.xls").touch()
+    (tmp_path / "notes.txt").touch()
+    return tmp_path
+
+
+class TestFileDiscovery:
+    """Test Excel file discovery."""
+
+    def test_discovers_only_excel_files_sorted(self, data_dir):
+        """Test that only .xlsx/.xls files are returned, sorted by name."""
+        files = FileDiscovery(str(data_dir)).discover_excel_files()
+
+        assert [f.name for f in files] == ["IBI trans 2024.xlsx", "old.xls"]
+
+    def test_new_file_invalidates_cache(self, data_dir):
+        """Test that adding a file is picked up on the next scan."""
+        discovery = FileDiscovery(str(data_dir))
+        assert len(discovery.discover_excel_files()) == 2
+
+        (data_dir / "IBI trans 2025.xlsx").touch()
+        stat = data_dir.stat()
+        os.utime(data_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert [f.name for f in discovery.discover_excel_files()] == [
+            "IBI trans 2024.xlsx", "IBI trans 2025.xlsx", "old.xls"
+        ]
+
+    def test_missing_directory_raises(self, tmp_path):
+        """Test that a missing data directory raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            FileDiscovery(str(tmp_path / "missing")).discover_excel_files()
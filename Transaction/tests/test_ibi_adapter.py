@@ -0,0 +1,74 @@
+"""
+Unit tests for IBIAdapter.
+
+Tests the transformation of raw IBI Excel data to the standard format.
+"""
+
+import pandas as pd
+import pytest
+from src.adapters.ibi_adapter import IBIAdapter
+
+
+@pytest.fixture
+def adapter():
+    """Get IBI adapter instance."""
+    return IBIAdapter()
+
+
+@pytest.fixture
+def raw_df(adapter):
+    """Raw IBI DataFrame with Hebrew column names."""
+    mapping = adapter.get_column_mapping()
+    data = {
+        'date': ['01/02/2024', '03/02/2024', '05/02/2024'],
+        'transaction_type': ['קניה שח', 'מכירה חול מטח', 'דיבידנד'],
+        'security_name': ['טבע', 'APPLE INC', 'טבע'],
+        'security_symbol': ['629014', 'AAPL', '629014'],
+        'quantity': [10, 5, 0],
+        'execution_price': [4500, 180.5, 0],
+        'currency': ['₪', '$', '₪'],
+        'transaction_fee': [5.0, 2.5, 0],
+        'additional_fees': [0, 0.5, 0],
+        'amount_foreign_currency': [0, 902.5, 0],
+        'amount_local_currency': [-450.0, 3249.0, 12.345678],
+        'balance': [1000.0, 4249.0, 4261.35],
+        'capital_gains_tax_estimate': [0, 0, 0],
+    }
+    return pd.DataFrame({mapping[key]: values for key, values in data.items()})
+
+
+class TestIBIAdapterTransform:
+    """Test IBIAdapter.transform."""
+
+    def test_renames_and_parses(self, adapter, raw_df):
+        """Test columns are renamed and dates parsed in DD/MM/YYYY format."""
+        df = adapter.transform(raw_df)
+
+        assert 'transaction_type' in df.columns
+        assert df['date'].tolist() == [
+            pd.Timestamp(2024, 2, 1), pd.Timestamp(2024, 2, 3), pd.Timestamp(2024, 2, 5)
+        ]
+        assert pd.api.types.is_numeric_dtype(df['quantity'])
+
+    def test_metadata_columns_are_categorical(self, adapter, raw_df):
+        """Test low-cardinality string columns are stored as categoricals."""
+        df = adapter.transform(raw_df)
+
+        for col in ('currency', 'bank', 'account_type'):
+            assert isinstance(df[col].dtype, pd.CategoricalDtype)
+        assert set(df['bank']) == {'IBI'}
+
+    def test_transaction_ids(self, adapter, raw_df):
+        """Test generated IDs combine date, type, symbol and amount."""
+        df = adapter.transform(raw_df)
+
+        assert df['id'].tolist() == [
+            'IBI_20240201_קניה__629014_450.0',
+            'IBI_20240203_מכירה_AAPL_3249.0',
+            'IBI_20240205_דיביד_629014_12.34567',
+        ]
+
+    def test_missing_columns_raise(self, adapter, raw_df):
+        """Test missing required columns are reported."""
+        with pytest.raises(ValueError, match='balance'):
+            adapter.transform(raw_df.drop(columns=['יתרה שקלית']))
@@ -0,0 +1,84 @@
+"""
+Unit tests for JSONAdapter.
+
+Tests DataFrame to Transaction conversion and export statistics.
+"""
+
+import pandas as pd
+import pytest
+from src.adapters.ibi_adapter import IBIAdapter
+from src.json_adapter import JSONAdapter
+
+
+@pytest.fixture
+def adapter():
+    """Get IBI adapter instance."""
+    return IBIAdapter()
+
+
+@pytest.fixture
+def df():
+    """Standardized (already transformed) IBI DataFrame."""
+    return pd.DataFrame({
+        'id': ['a', 'b', 'c'],
+        'date': pd.to_datetime(['2024-02-01', '2024-02-03', '2024-02-05']),
+        'transaction_type': ['קניה שח', 'מכירה שח', 'דיבידנד'],
+        'security_name': ['טבע', 'טבע', 'APPLE'],
+        'security_symbol': ['629014', '629014', 'AAPL'],
+        'quantity': [10, 5, 0],
+        'transaction_fee': [5.0, 2.5, 0.0],
+        'balance': [1000.0, 1500.0, 1512.0],
+    })
+
+
+class TestDataFrameToTransactions:
+    """Test JSONAdapter.dataframe_to_transactions."""
+
+    def test_converts_all_rows_with_defaults(self, adapter, df):
+        """Test every row is converted and missing columns get defaults."""
+        transactions = JSONAdapter().dataframe_to_transactions(df, adapter)
+
+        assert [t.id for t in transactions] == ['a', 'b', 'c']
+        assert transactions[0].quantity == 10.0
+        assert transactions[0].execution_price == 0.0
+        assert transactions[0].currency == '₪'
+        assert transactions[0].bank == 'IBI'
+        assert [t.category for t in transactions] == ['stocks', 'stocks', 'dividend']
+
+    def test_invalid_row_is_skipped(self, adapter, df):
+        """Test a row that fails validation is dropped and the rest kept."""
+        df['balance'] = df['balance'].astype(object)
+        df.loc[1, 'balance'] = 'n/a'
+
+        transactions = JSONAdapter().dataframe_to_transactions(df, adapter)
+
+        assert [t.id for t in transactions] == ['a', 'c']
+
+    def test_repeated_strings_share_one_object(self, adapter, df):
+        """Test equal low-cardinality strings are interned across transactions."""
+        # Build equal but distinct string objects, as the Excel parser does
+        df['security_symbol'] = [''.join(['629', '014']) for _ in range(len(df))]
+        df['transaction_type'] = [''.join(['קניה', ' שח']) for _ in range(len(df))]
+
+        transactions = JSONAdapter().dataframe_to_transactions(df, adapter)
+
+        assert transactions[0].security_symbol is transactions[1].security_symbol
+        assert transactions[0].transaction_type is transactions[1].transaction_type
+
+
+class TestCalculateStatistics:
+    """Test JSONAdapter._calculate_statistics."""
+
+    def test_statistics(self, adapter, df):
+        """Test counts and totals over converted transactions."""
+        json_adapter = JSONAdapter()
+        stats = json_adapter._calculate_statistics(
+            json_adapter.dataframe_to_transactions(df, adapter)
+        )
+
+        assert stats['transaction_type_counts'] == {'קניה שח': 1, 'מכירה שח': 1, 'דיבידנד': 1}
+        assert stats['unique_securities'] == 2
+        assert stats['total_fees'] == 7.5
+        assert (stats['total_buys'], stats['total_sells'], stats['total_dividends']) == (1, 1, 1)
+        assert stats['final_balance'] == 1512.0
+
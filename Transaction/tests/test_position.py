@@ -0,0 +1,41 @@
+"""
+Unit tests for Position model.
+"""
+
+import pickle
+import pytest
+from src.modules.portfolio_dashboard.position import Position
+
+
+@pytest.fixture
+def position():
+    """Position with market data."""
+    return Position(
+        security_name='Apple Inc',
+        security_symbol='AAPL',
+        quantity=10.0,
+        average_cost=150.0,
+        total_invested=1500.0,
+        currency='$',
+        current_price=180.0,
+        market_value=1800.0,
+    )
+
+
+class TestPosition:
+    """Test Position dataclass."""
+
+    def test_uses_slots(self, position):
+        """Test that Position instances have no per-instance __dict__."""
+        assert not hasattr(position, '__dict__')
+        with pytest.raises(AttributeError):
+            position.unknown_field = 1
+
+    def test_unrealized_pnl(self, position):
+        """Test P&L properties computed from market data."""
+        assert position.unrealized_pnl == 300.0
+        assert position.unrealized_pnl_pct == pytest.approx(20.0)
+
+    def test_pickle_round_trip(self, position):
+        """Test positions survive pickling (used by the dashboard cache)."""
+        assert pickle.loads(pickle.dumps(position)) == position
@@ -0,0 +1,192 @@
+"""
+Unit tests for the price fetcher.
+
+Network calls are replaced with canned yfinance responses.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+from streamlit.runtime.scriptrunner.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+from src.modules.portfolio_dashboard import price_fetcher
+from src.modules.portfolio_dashboard.position import Position
+
+
+def make_download_frame(closes: dict) -> pd.DataFrame:
+    """Build a frame shaped like yf.download(..., group_by='ticker')."""
+    index = pd.DatetimeIndex([pd.Timestamp(2024, 1, 15)])
+    columns = pd.MultiIndex.from_product([list(closes), ['Open', 'Close']])
+    values = [[price, price] for price in closes.values()]
+    return pd.DataFrame([np.ravel(values)], index=index, columns=columns)
+
+
+@pytest.fixture(autouse=True)
+def no_network(monkeypatch):
+    """Clear cached prices and make rate-limit sleeps instant."""
+    price_fetcher.clear_price_cache()
+    monkeypatch.setattr(price_fetcher.time, 'sleep', lambda _: None)
+    yield
+    price_fetcher.clear_price_cache()
+
+
+class TestBatchPriceFetching:
+    """Test batched price download with per-symbol fallback."""
+
+    def test_download_parses_closing_prices(self, monkeypatch):
+        """Test closing prices are read per ticker from the batch response."""
+        frame = make_download_frame({'AAPL': 180.5, 'MSFT': np.nan})
+        monkeypatch.setattr(price_fetcher.yf, 'download', lambda **kwargs: frame)
+
+        prices = price_fetcher._download_closing_prices(['AAPL', 'MSFT', 'GOOGL'])
+
+        assert prices == {'AAPL': 180.5, 'MSFT': None, 'GOOGL': None}
+
+    def test_download_failure_returns_none(self, monkeypatch):
+        """Test a failed or empty batch download is reported as None."""
+        def failing_download(**kwargs):
+            raise ConnectionError("offline")
+        monkeypatch.setattr(price_fetcher.yf, 'download', failing_download)
+        assert price_fetcher._download_closing_prices(['AAPL']) is None
+
+        monkeypatch.setattr(price_fetcher.yf, 'download', lambda **kwargs: pd.DataFrame())
+        assert price_fetcher._download_closing_prices(['AAPL']) is None
+
+    def test_failed_batch_skips_fallback(self, monkeypatch):
+        """Test a failed batch raises instead of fetching every symbol."""
+        monkeypatch.setattr(price_fetcher.yf, 'download', lambda **kwargs: pd.DataFrame())
+
+        def unexpected_fetch(symbol, currency="$"):
+            raise AssertionError("should not fetch individually after a failed batch")
+        monkeypatch.setattr(price_fetcher, 'fetch_current_price', unexpected_fetch)
+
+        with pytest.raises(price_fetcher.PriceFetchError):
+            price_fetcher.fetch_multiple_prices_batch(['AAPL', 'MSFT'], "$")
+
+    def test_batch_falls_back_for_missing_symbols(self, monkeypatch):
+        """Test only symbols missing from the batch are fetched individually."""
+        frame = make_download_frame({'AAPL': 180.5})
+        monkeypatch.setattr(price_fetcher.yf, 'download', lambda **kwargs: frame)
+
+        fetched = []
+        def fake_fetch(symbol, currency="$"):
+            fetched.append(symbol)
+            return 99.0
+        monkeypatch.setattr(price_fetcher, 'fetch_current_price', fake_fetch)
+
+        prices = price_fetcher.fetch_multiple_prices_batch(['AAPL', 'MSFT'], "$")
+
+        assert prices == {'AAPL': 180.5, 'MSFT': 99.0}
+        assert fetched == ['MSFT']
+
+    def test_fallback_fetches_all_missing_symbols(self, monkeypatch):
+        """Test every missing symbol is fetched once on the worker pool."""
+        symbols = ['AAPL', 'MSFT', 'GOOGL', 'NVDA', 'AMZN', 'META']
+        frame = make_download_frame({symbol: np.nan for symbol in symbols})
+        monkeypatch.setattr(price_fetcher.yf, 'download', lambda **kwargs: frame)
+
+        fetched = []
+        def fake_fetch(symbol, currency="$"):
+            fetched.append(symbol)
+            return None if symbol == 'META' else float(len(symbol))
+        monkeypatch.setattr(price_fetcher, 'fetch_current_price', fake_fetch)
+
+        prices = price_fetcher.fetch_multiple_prices_batch(symbols, "$")
+
+        assert sorted(fetched) == sorted(symbols)
+        assert prices == {s: (None if s == 'META' else float(len(s))) for s in symbols}
+
+    def test_fallback_requests_are_spaced(self, monkeypatch):
+        """Test every fallback request after the first waits RATE_LIMIT_DELAY."""
+        symbols = ['AAPL', 'MSFT', 'GOOGL']
+        frame = make_download_frame({symbol: np.nan for symbol in symbols})
+        monkeypatch.setattr(price_fetcher.yf, 'download', lambda **kwargs: frame)
+        monkeypatch.setattr(price_fetcher, 'fetch_current_price', lambda symbol, currency="$": 1.0)
+
+        delays = []
+        monkeypatch.setattr(price_fetcher.time, 'sleep', delays.append)
+
+        price_fetcher.fetch_multiple_prices_batch(symbols, "$")
+
+        assert delays == [price_fetcher.RATE_LIMIT_DELAY] * (len(symbols) - 1)
+
+    def test_fallback_workers_get_script_run_context(self, monkeypatch):
+        """Test pool workers run with the caller's ScriptRunContext attached."""
+        frame = make_download_frame({'AAPL': np.nan, 'MSFT': np.nan})
+        monkeypatch.setattr(price_fetcher.yf, 'download', lambda **kwargs: frame)
+
+        ctx = object()
+        monkeypatch.setattr(price_fetcher, 'get_script_run_ctx', lambda: ctx)
+
+        seen = []
+        def fake_fetch(symbol, currency="$"):
+            seen.append(getattr(threading.current_thread(), SCRIPT_RUN_CONTEXT_ATTR_NAME, None))
+            return 1.0
+        monkeypatch.setattr(price_fetcher, 'fetch_current_price', fake_fetch)
+
+        price_fetcher.fetch_multiple_prices_batch(['AAPL', 'MSFT'], "$")
+
+        assert seen == [ctx, ctx]
+
+    def test_nis_symbols_are_skipped(self, monkeypatch):
+        """Test TASE symbols are not requested at all."""
+        def unexpected_download(**kwargs):
+            raise AssertionError("should not download NIS symbols")
+        monkeypatch.setattr(price_fetcher.yf, 'download', unexpected_download)
+
+        assert price_fetcher.fetch_multiple_prices_batch(['629014'], "₪") == {'629014': None}
+
+
+class TestFetchMultiplePrices:
+    """Test currency grouping for position price fetches."""
+
+    def test_groups_by_currency_and_dedupes(self, monkeypatch):
+        """Test USD symbols are batched once each and NIS symbols skipped."""
+        calls = []
+        def fake_batch(symbols, currency="$", progress_callback=None):
+            calls.append((tuple(symbols), currency))
+            return {symbol: 10.0 for symbol in symbols}
+        monkeypatch.setattr(price_fetcher, 'fetch_multiple_prices_batch', fake_batch)
+
+        positions = [
+            Position('Apple', 'AAPL', 5, 100, 500, '$'),
+            Position('Teva', '629014', 10, 40, 400, '₪'),
+            Position('Apple', 'AAPL', 1, 120, 120, '$'),
+            Position('Microsoft', 'MSFT', 2, 300, 600, '$'),
+        ]
+
+        prices = price_fetcher.fetch_multiple_prices(positions)
+
+        assert calls == [(('AAPL', 'MSFT'), '$')]
+        assert prices == {'AAPL': 10.0, 'MSFT': 10.0, '629014': None}
+
+
+class TestUpdatePositions:
+    """Test price updates on Position objects."""
+
+    def test_unavailable_prices_warn_user(self, monkeypatch):
+        """Test positions are left untouched and a warning is shown when offline."""
+        def failing_download(**kwargs):
+            raise ConnectionError("offline")
+        monkeypatch.setattr(price_fetcher.yf, 'download', failing_download)
+
+        warnings = []
+        monkeypatch.setattr(price_fetcher.st, 'warning', warnings.append)
+
+        positions = [Position('Apple', 'AAPL', 5, 100, 500, '$')]
+        result = price_fetcher.update_positions_with_prices(positions)
+
+        assert result is positions
+        assert positions[0].current_price is None
+        assert len(warnings) == 1
+
+    def test_online_updates_prices(self, monkeypatch):
+        """Test prices and market values are filled in when reachable."""
+        monkeypatch.setattr(price_fetcher, 'fetch_multiple_prices', lambda positions: {'AAPL': 150.0})
+
+        positions = [Position('Apple', 'AAPL', 5, 100, 500, '$')]
+        price_fetcher.update_positions_with_prices(positions)
+
+        assert positions[0].current_price == 150.0
+        assert positions[0].market_value == 750.0